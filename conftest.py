@@ -0,0 +1 @@
+"""Pytest configuration: makes the ``src`` package importable from the repo root."""
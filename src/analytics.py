@@ -10,11 +10,23 @@ License: MIT
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+
+try:
+    from numba import njit, prange, types
+except ImportError:  # pragma: no cover - numba is optional
+    prange = range
+    types = None
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -27,10 +39,118 @@ COST_THRESHOLD_RED = 0.75
 RISK_SCORE_HIGH = 75
 RISK_SCORE_MEDIUM = 50
 
+# Health score lookup tables: points awarded per SPI/CPI band, indexed by
+# the number of thresholds the index meets or exceeds
+SCHEDULE_THRESHOLDS = np.array([SCHEDULE_THRESHOLD_RED, SCHEDULE_THRESHOLD_YELLOW, 1.0])
+SCHEDULE_SCORES = np.array([0.0, 10.0, 25.0, 40.0])
+COST_THRESHOLDS = np.array([COST_THRESHOLD_RED, COST_THRESHOLD_YELLOW, 1.0])
+COST_SCORES = np.array([0.0, 10.0, 25.0, 40.0])
+HEALTH_THRESHOLDS = np.array([50.0, 75.0])
+
+# Health status labels indexed by the status code from _health_core
+HEALTH_STATUSES = ("Red", "Yellow", "Green")
+
+# Portfolio KPI arrays stay float64: storing inputs as float32 rounds values
+# such as 0.95 just below the band thresholds, so the batch path would
+# disagree with calculate_metrics
+KPI_DTYPE = np.float64
+
+# Portfolio input columns and their defaults, matching calculate_metrics
+PORTFOLIO_COLUMNS = {
+    'earned_value': 0,
+    'planned_value': 100,
+    'actual_cost': 0,
+    'schedule_variance': 0,
+    'cost_variance': 0,
+    'team_utilization': 0,
+}
+
+# Numba's on-disk cache records the defining module name, so a cache written
+# by ``import src.analytics`` cannot be loaded when the file runs as a script
+JIT_CACHE = __name__ != "__main__"
+
+# Explicit kernel signatures: Numba compiles these eagerly at import (or
+# loads them from the cache) and never specializes again on a request path.
+# The array types must match KPI_DTYPE and the int8 status codes; inputs are
+# typed read-only so arrays pandas hands out as read-only views are accepted.
+HEALTH_CORE_SIGNATURE = "Tuple((intp, float64))(float64, float64, float64)"
+RISK_CORE_SIGNATURE = "float64(float64, float64, float64)"
+SCORE_PORTFOLIO_SIGNATURE = None
+if types is not None:
+    _kpi_input = types.Array(types.float64, 1, 'A', readonly=True)
+    SCORE_PORTFOLIO_SIGNATURE = types.void(*[_kpi_input] * 6,
+                                           *[types.float64[:]] * 3,
+                                           types.int8[:])
+
+
+@njit(HEALTH_CORE_SIGNATURE, cache=JIT_CACHE)
+def _health_core(spi, cpi, risk_score):
+    """Scalar health scoring kernel, returns (status_code, score).
+    
+    searchsorted places NaN above every threshold, so a NaN SPI or CPI is
+    skipped explicitly and earns no points (x == x is False only for NaN).
+    """
+    # Schedule and cost components (40% weight each) via band lookup
+    score = 0.0
+    if spi == spi:
+        score += SCHEDULE_SCORES[np.searchsorted(SCHEDULE_THRESHOLDS, spi, side='right')]
+    if cpi == cpi:
+        score += COST_SCORES[np.searchsorted(COST_THRESHOLDS, cpi, side='right')]
+    
+    # Risk component (20% weight), no points for a NaN risk score
+    risk_adjustment = 20 * (1 - risk_score / 100)
+    if risk_adjustment > 0:
+        score += risk_adjustment
+    
+    return np.searchsorted(HEALTH_THRESHOLDS, score, side='right'), score
+
+
+@njit(RISK_CORE_SIGNATURE, cache=JIT_CACHE)
+def _risk_core(sv, cv, avg_factors):
+    """Scalar risk scoring kernel given the mean of the risk factors."""
+    # Schedule and cost risk (30% weight each)
+    base_score = min(100.0, abs(sv) * 10) * 0.3
+    base_score += min(100.0, abs(cv) * 10) * 0.3
+    
+    # Other factors (40% weight)
+    base_score += avg_factors * 0.4
+    
+    return min(100.0, base_score)
+
+
+@njit(SCORE_PORTFOLIO_SIGNATURE, parallel=True, cache=JIT_CACHE)
+def _score_portfolio(ev, pv, ac, sv, cv, rf_mean,
+                     out_spi, out_cpi, out_risk, out_status):
+    """Fused portfolio kernel writing SPI, CPI, risk and health per project.
+    
+    Each project's inputs are read once and all four outputs are produced
+    in the same pass, instead of materializing a temporary array per step.
+    """
+    for i in prange(ev.shape[0]):
+        spi = ev[i] / pv[i] if pv[i] != 0 else 0.0
+        cpi = ev[i] / ac[i] if ac[i] > 0 else 1.0
+        risk = _risk_core(sv[i], cv[i], rf_mean[i])
+        status, _ = _health_core(spi, cpi, risk)
+        out_spi[i] = spi
+        out_cpi[i] = cpi
+        out_risk[i] = risk
+        out_status[i] = status
+
+
+def _risk_factor_means(risk_factors, n: int) -> np.ndarray:
+    """Average each project's risk factor list, treating missing lists as 0."""
+    return np.fromiter(
+        (sum(rf) / len(rf) if hasattr(rf, '__len__') and len(rf) else 0.0
+         for rf in risk_factors),
+        dtype=KPI_DTYPE, count=n)
+
 
 @dataclass
 class ProjectMetrics:
-    """Data class for project KPIs and metrics."""
+    """Data class for project KPIs and metrics.
+    
+    Values are stored unrounded; round them when presenting or serializing.
+    """
     project_id: str
     schedule_performance_index: float
     cost_performance_index: float
@@ -58,6 +178,7 @@ class ProjectAnalytics:
         """
         self.project_data = project_data
         self.metrics_cache = {}
+        self.metrics_cache_inputs = {}
         logger.info("ProjectAnalytics initialized")
     
     def calculate_schedule_performance_index(self, 
@@ -81,8 +202,9 @@ class ProjectAnalytics:
             return 0.0
         
         spi = earned_value / planned_value
-        logger.debug(f"Calculated SPI: {spi:.2f}")
-        return round(spi, 3)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calculated SPI: %.2f", spi)
+        return spi
     
     def calculate_cost_performance_index(self,
                                         earned_value: float,
@@ -105,8 +227,9 @@ class ProjectAnalytics:
             return 0.0
         
         cpi = earned_value / actual_cost
-        logger.debug(f"Calculated CPI: {cpi:.2f}")
-        return round(cpi, 3)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calculated CPI: %.2f", cpi)
+        return cpi
     
     def calculate_project_health(self, 
                                 spi: float, 
@@ -124,35 +247,8 @@ class ProjectAnalytics:
         Returns:
             Tuple of (health_status, health_percentage)
         """
-        score = 0
-        
-        # Schedule component (40% weight)
-        if spi >= 1.0:
-            score += 40
-        elif spi >= SCHEDULE_THRESHOLD_YELLOW:
-            score += 25
-        elif spi >= SCHEDULE_THRESHOLD_RED:
-            score += 10
-        
-        # Cost component (40% weight)
-        if cpi >= 1.0:
-            score += 40
-        elif cpi >= COST_THRESHOLD_YELLOW:
-            score += 25
-        elif cpi >= COST_THRESHOLD_RED:
-            score += 10
-        
-        # Risk component (20% weight)
-        risk_adjustment = max(0, 20 * (1 - risk_score / 100))
-        score += risk_adjustment
-        
-        # Determine status
-        if score >= 75:
-            status = "Green"
-        elif score >= 50:
-            status = "Yellow"
-        else:
-            status = "Red"
+        code, score = _health_core(spi, cpi, risk_score)
+        status = HEALTH_STATUSES[code]
         
         logger.info(f"Project health: {status} ({score:.0f}%)")
         return status, int(score)
@@ -174,30 +270,33 @@ class ProjectAnalytics:
         Returns:
             Risk score 0-100
         """
-        base_score = 0
-        
-        # Schedule risk (30% weight)
-        schedule_risk = min(100, abs(schedule_variance) * 10)
-        base_score += schedule_risk * 0.3
-        
-        # Cost risk (30% weight)
-        cost_risk = min(100, abs(cost_variance) * 10)
-        base_score += cost_risk * 0.3
+        # Risk factor lists are usually a handful of values, where a plain
+        # sum beats the overhead of converting to an array for np.mean
+        n_factors = len(risk_factors) if risk_factors is not None else 0
+        avg_factors = 0.0
+        if n_factors > 64:
+            avg_factors = float(np.mean(risk_factors))
+        elif n_factors:
+            avg_factors = sum(risk_factors) / n_factors
         
-        # Other factors (40% weight)
-        if risk_factors:
-            avg_factors = np.mean(risk_factors)
-            base_score += avg_factors * 0.4
-        
-        final_score = min(100, base_score)
-        logger.debug(f"Calculated risk score: {final_score:.1f}")
-        return round(final_score, 1)
+        final_score = _risk_core(schedule_variance, cost_variance, avg_factors)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calculated risk score: %.1f", final_score)
+        return final_score
     
-    def calculate_metrics(self, project_id: str, **kwargs) -> ProjectMetrics:
+    def calculate_metrics(self, project_id: str,
+                          calculated_at: Optional[datetime] = None,
+                          **kwargs) -> ProjectMetrics:
         """Calculate all metrics for a project.
         
+        Repeated calls with unchanged inputs return the cached
+        ProjectMetrics instead of recomputing them; a cached result keeps
+        its original timestamp unless calculated_at is passed.
+        
         Args:
             project_id: Unique project identifier
+            calculated_at: Timestamp to record; callers scoring a batch
+                can pass one shared value. Defaults to datetime.now()
             **kwargs: Project data (ev, pv, ac, sv, cv, etc.)
             
         Returns:
@@ -211,13 +310,30 @@ class ProjectAnalytics:
             cv = kwargs.get('cost_variance', 0)
             completion = kwargs.get('completion_percentage', 0)
             utilization = kwargs.get('team_utilization', 0)
+            risk_factors = kwargs.get('risk_factors')
+            if risk_factors is None:
+                risk_factors = []
+            
+            # Reuse cached metrics when the project's inputs are unchanged
+            cache_key = (ev, pv, ac, sv, cv, completion, utilization,
+                         tuple(risk_factors))
+            # Each input key is stored with the metrics it produced, and a
+            # hit also requires that entry to still be the one in
+            # metrics_cache, so edits to the public cache just force a miss
+            cached_key, cached = self.metrics_cache_inputs.get(project_id, (None, None))
+            if (cached_key == cache_key
+                    and self.metrics_cache.get(project_id) is cached):
+                if calculated_at is not None:
+                    cached = replace(cached, calculated_at=calculated_at)
+                    self.metrics_cache[project_id] = cached
+                    self.metrics_cache_inputs[project_id] = (cache_key, cached)
+                return cached
             
             # Calculate indices
             spi = self.calculate_schedule_performance_index(ev, pv)
             cpi = self.calculate_cost_performance_index(ev, ac) if ac > 0 else 1.0
             
             # Calculate risk
-            risk_factors = kwargs.get('risk_factors', [])
             risk_score = self.calculate_risk_score(sv, cv, risk_factors)
             
             # Determine health
@@ -234,11 +350,12 @@ class ProjectAnalytics:
                 team_utilization=utilization,
                 completion_percentage=completion,
                 health_status=health_status,
-                calculated_at=datetime.now()
+                calculated_at=calculated_at or datetime.now()
             )
             
             # Cache the result
             self.metrics_cache[project_id] = metrics
+            self.metrics_cache_inputs[project_id] = (cache_key, metrics)
             logger.info(f"Calculated metrics for project {project_id}")
             
             return metrics
@@ -258,45 +375,83 @@ class ProjectAnalytics:
         """
         return self.metrics_cache.get(project_id)
     
-    def calculate_portfolio_metrics(self, projects: List[Dict]) -> Dict:
+    def calculate_portfolio_metrics(self,
+                                    projects: Union[List[Dict], pd.DataFrame]) -> Dict:
         """Calculate aggregate metrics across project portfolio.
         
+        KPIs are computed column-wise over the whole portfolio with NumPy
+        rather than per project, so individual ProjectMetrics are not
+        cached here; use calculate_metrics for single-project lookups.
+        
+        A DataFrame with one row per project and the PORTFOLIO_COLUMNS as
+        columns is the fast path: each column is handed to the scoring
+        kernel as a contiguous array. Risk factors may be given either as a
+        ``risk_factor_mean`` column or as per-row lists in ``risk_factors``.
+        A list of project dicts is still accepted, but every field is then
+        read with a dict lookup per project, so prefer the DataFrame form
+        for large portfolios.
+        
         Args:
-            projects: List of project data dictionaries
+            projects: DataFrame of project data, or list of project
+                dictionaries with the values under a 'data' key
             
         Returns:
             Dictionary with portfolio-level metrics
         """
-        if not projects:
+        n = len(projects)
+        if not n:
             logger.warning("No projects provided for portfolio analysis")
             return {}
         
-        portfolio_metrics = {
-            'total_projects': len(projects),
-            'avg_health_score': 0,
-            'at_risk_count': 0,
-            'avg_budget_utilization': 0,
-            'avg_schedule_health': 0,
-        }
+        if isinstance(projects, pd.DataFrame):
+            # Missing cells get the same defaults as missing dict keys
+            columns = {
+                key: (projects[key].fillna(default).to_numpy(dtype=KPI_DTYPE)
+                      if key in projects.columns
+                      else np.full(n, default, dtype=KPI_DTYPE))
+                for key, default in PORTFOLIO_COLUMNS.items()
+            }
+            if 'risk_factor_mean' in projects.columns:
+                risk_factor_means = (projects['risk_factor_mean'].fillna(0)
+                                     .to_numpy(dtype=KPI_DTYPE))
+            elif 'risk_factors' in projects.columns:
+                risk_factor_means = _risk_factor_means(projects['risk_factors'], n)
+            else:
+                risk_factor_means = np.zeros(n, dtype=KPI_DTYPE)
+        else:
+            data = [proj.get('data', {}) for proj in projects]
+            columns = {
+                key: np.fromiter((d.get(key, default) for d in data),
+                                 dtype=KPI_DTYPE, count=n)
+                for key, default in PORTFOLIO_COLUMNS.items()
+            }
+            risk_factor_means = _risk_factor_means(
+                (d.get('risk_factors') for d in data), n)
         
-        health_scores = []
-        utilizations = []
-        schedule_indices = []
+        ev = columns['earned_value']
+        pv = columns['planned_value']
+        ac = columns['actual_cost']
+        sv = columns['schedule_variance']
+        cv = columns['cost_variance']
+        utilization = columns['team_utilization']
         
-        for proj in projects:
-            metrics = self.calculate_metrics(proj['id'], **proj.get('data', {}))
-            health_scores.append(metrics.risk_score)
-            utilizations.append(metrics.team_utilization)
-            schedule_indices.append(metrics.schedule_performance_index)
-            
-            if metrics.health_status == 'Red':
-                portfolio_metrics['at_risk_count'] += 1
+        # Same rules as the scalar calculate_* methods, in one fused pass
+        spi = np.empty(n, dtype=KPI_DTYPE)
+        cpi = np.empty(n, dtype=KPI_DTYPE)
+        risk = np.empty(n, dtype=KPI_DTYPE)
+        status = np.empty(n, dtype=np.int8)
+        _score_portfolio(ev, pv, ac, sv, cv, risk_factor_means,
+                         spi, cpi, risk, status)
         
-        portfolio_metrics['avg_health_score'] = np.mean(health_scores) if health_scores else 0
-        portfolio_metrics['avg_budget_utilization'] = np.mean(utilizations) if utilizations else 0
-        portfolio_metrics['avg_schedule_health'] = np.mean(schedule_indices) if schedule_indices else 0
+        portfolio_metrics = {
+            'total_projects': n,
+            'avg_health_score': float(risk.mean()),
+            'at_risk_count': int(np.count_nonzero(status == 0)),
+            'avg_budget_utilization': float(utilization.mean()),
+            'avg_schedule_health': float(spi.mean()),
+        }
         
-        logger.info(f"Calculated portfolio metrics for {len(projects)} projects")
+        logger.info(f"Calculated portfolio metrics for {n} projects")
         return portfolio_metrics
 
 
@@ -320,6 +475,6 @@ if __name__ == "__main__":
     )
     
     print(f"Project Status: {sample_metrics.health_status}")
-    print(f"Schedule Performance: {sample_metrics.schedule_performance_index}")
-    print(f"Cost Performance: {sample_metrics.cost_performance_index}")
-    print(f"Risk Score: {sample_metrics.risk_score}")
+    print(f"Schedule Performance: {sample_metrics.schedule_performance_index:.3f}")
+    print(f"Cost Performance: {sample_metrics.cost_performance_index:.3f}")
+    print(f"Risk Score: {sample_metrics.risk_score:.1f}")
@@ -0,0 +1,94 @@
+"""Tests for the project analytics module."""
+
+import math
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from src.analytics import ProjectAnalytics
+
+
+@pytest.fixture
+def analytics():
+    return ProjectAnalytics()
+
+
+@pytest.mark.parametrize("spi, cpi, risk_score, expected", [
+    (math.nan, 1.0, 10, ("Yellow", 58)),
+    (1.0, math.nan, 10, ("Yellow", 58)),
+    (math.nan, math.nan, 10, ("Red", 18)),
+    (1.0, 1.0, math.nan, ("Green", 80)),
+])
+def test_project_health_nan_inputs_score_lowest_band(analytics, spi, cpi,
+                                                     risk_score, expected):
+    assert analytics.calculate_project_health(spi, cpi, risk_score) == expected
+
+
+def test_project_health_band_boundaries_are_inclusive(analytics):
+    assert analytics.calculate_project_health(0.95, 0.90, 50) == ("Yellow", 60)
+    assert analytics.calculate_project_health(0.85, 0.75, 0) == ("Red", 40)
+
+
+def test_portfolio_counts_nan_earned_value_as_at_risk(analytics):
+    projects = [{'id': 'PROJ-001', 'data': {'earned_value': math.nan,
+                                            'actual_cost': 10}}]
+    metrics = analytics.calculate_portfolio_metrics(projects)
+    assert metrics['at_risk_count'] == 1
+
+
+@pytest.mark.parametrize("data", [
+    {'earned_value': 0.95, 'planned_value': 1},
+    {'earned_value': 17, 'actual_cost': 17 / 0.9, 'planned_value': 17},
+])
+def test_portfolio_matches_single_project_at_band_thresholds(analytics, data):
+    single = analytics.calculate_metrics('PROJ-001', **data)
+    portfolio = analytics.calculate_portfolio_metrics([{'id': 'PROJ-001',
+                                                        'data': data}])
+    assert portfolio['at_risk_count'] == (single.health_status == 'Red')
+    assert portfolio['avg_schedule_health'] == single.schedule_performance_index
+
+
+def test_portfolio_dataframe_fills_missing_cells_like_missing_keys(analytics):
+    records = [
+        {'earned_value': 90, 'planned_value': 100, 'actual_cost': 80,
+         'team_utilization': 0.8, 'risk_factors': [10, 20]},
+        {'earned_value': 40, 'actual_cost': 60},
+    ]
+    from_dicts = analytics.calculate_portfolio_metrics(
+        [{'id': f'PROJ-{i}', 'data': data} for i, data in enumerate(records)])
+    from_frame = analytics.calculate_portfolio_metrics(pd.DataFrame(records))
+    assert from_frame == pytest.approx(from_dicts)
+
+
+def test_cached_metrics_take_the_new_calculated_at(analytics):
+    first = datetime(2026, 1, 1)
+    second = datetime(2026, 1, 2)
+    analytics.calculate_metrics('PROJ-001', calculated_at=first, earned_value=50)
+    metrics = analytics.calculate_metrics('PROJ-001', calculated_at=second,
+                                          earned_value=50)
+    assert metrics.calculated_at == second
+    assert analytics.get_project_metrics('PROJ-001').calculated_at == second
+
+
+@pytest.mark.parametrize("edit_cache", [
+    lambda cache: cache.clear(),
+    lambda cache: cache.pop('PROJ-001'),
+    lambda cache: cache.update({'PROJ-001': None}),
+])
+def test_metrics_recomputed_after_cache_is_edited(analytics, edit_cache):
+    first = analytics.calculate_metrics('PROJ-001', earned_value=50)
+    edit_cache(analytics.metrics_cache)
+    metrics = analytics.calculate_metrics('PROJ-001', earned_value=50)
+    assert metrics is not first
+    assert metrics.risk_score == first.risk_score
+    assert analytics.get_project_metrics('PROJ-001') is metrics
+
+
+def test_metrics_reused_when_inputs_unchanged(analytics):
+    first = analytics.calculate_metrics('PROJ-001', earned_value=50,
+                                        risk_factors=[10, 20])
+    assert analytics.calculate_metrics('PROJ-001', earned_value=50,
+                                       risk_factors=[10, 20]) is first
+    assert analytics.calculate_metrics('PROJ-001', earned_value=60,
+                                       risk_factors=[10, 20]) is not first
@@ -0,0 +1,126 @@
+"""Tests for the data processing module."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processor import DataProcessor
+
+
+@pytest.fixture
+def processor():
+    return DataProcessor()
+
+
+@pytest.fixture
+def projects():
+    return pd.DataFrame({
+        'project_id': ['PROJ-001', None, 'PROJ-003', 'PROJ-004'],
+        'status': ['Active', 'Completed', None, 'Active'],
+        'department': ['IT', 'Finance', 'IT', np.nan],
+        'budget': [100000.0, np.nan, 50000.0, 75000.0],
+        'completion_percentage': [50.0, 100.0, np.nan, 25.0],
+        'total_tasks': [10, 20, 30, 40],
+    })
+
+
+def test_clean_missing_values_fills_by_dtype(processor, projects):
+    cleaned = processor.clean_missing_values(projects, fill_numeric=-1,
+                                             fill_text="Unknown")
+    assert cleaned['project_id'].tolist() == ['PROJ-001', 'Unknown', 'PROJ-003', 'PROJ-004']
+    assert cleaned['status'].tolist() == ['Active', 'Completed', 'Unknown', 'Active']
+    assert cleaned['budget'].tolist() == [100000.0, -1, 50000.0, 75000.0]
+    assert cleaned['completion_percentage'].tolist() == [50.0, 100.0, -1, 25.0]
+    assert cleaned['total_tasks'].tolist() == [10, 20, 30, 40]
+    assert projects['budget'].isna().sum() == 1
+
+
+def test_aggregate_by_department(processor, projects):
+    aggregation = processor.aggregate_by_department(projects)
+    assert list(aggregation)[:2] == ['IT', 'Finance']
+    assert aggregation['IT'] == {'project_count': 2, 'avg_completion': 50.0,
+                                 'total_budget': 150000.0}
+    assert aggregation['Finance'] == {'project_count': 1, 'avg_completion': 100.0,
+                                      'total_budget': 0.0}
+
+
+def test_aggregate_by_department_keeps_missing_department(processor, projects):
+    aggregation = processor.aggregate_by_department(projects)
+    missing = [key for key in aggregation if isinstance(key, float) and math.isnan(key)]
+    assert len(missing) == 1
+    assert aggregation[missing[0]]['project_count'] == 1
+    assert aggregation[missing[0]]['total_budget'] == 75000.0
+
+
+def test_aggregate_by_department_without_optional_columns(processor):
+    aggregation = processor.aggregate_by_department(
+        pd.DataFrame({'department': ['IT', 'HR', 'IT']}))
+    assert aggregation == {
+        'IT': {'project_count': 2, 'avg_completion': 0, 'total_budget': 0},
+        'HR': {'project_count': 1, 'avg_completion': 0, 'total_budget': 0},
+    }
+
+
+@pytest.mark.parametrize("frame, expected", [
+    (pd.DataFrame({'a': [1.0, np.nan], 'b': [np.nan, np.nan]}), 25.0),
+    (pd.DataFrame({'a': [1.0, np.nan], 'b': ['x', None]}), 50.0),
+    (pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']}), 100.0),
+])
+def test_validate_data_quality(processor, frame, expected):
+    assert processor.validate_data_quality(frame) == expected
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_filter_by_status(processor, projects, categorical):
+    if categorical:
+        projects = projects.astype({'status': 'category'})
+    active = processor.filter_by_status(projects, 'Active')
+    assert active['project_id'].tolist() == ['PROJ-001', 'PROJ-004']
+    assert processor.filter_by_status(projects, 'On-Hold').empty
+
+
+def test_transforms_do_not_alias_the_input(processor):
+    source = pd.DataFrame({
+        'start': ['2024-01-01', '2024-02-01'],
+        'budget': [100.0, 200.0],
+        'actual_cost': [80.0, 250.0],
+        'tasks_completed': [1, 2],
+        'total_tasks': [4, 4],
+        'notes': ['a', None],
+    })
+    original = source.copy()
+    
+    derived = processor.calculate_derived_fields(source)
+    derived.loc[0, 'budget'] = 1.0
+    normalized = processor.normalize_dates(source, ['start'])
+    normalized['budget'] *= 10
+    cleaned = processor.clean_missing_values(source)
+    cleaned.loc[0, 'actual_cost'] = 1.0
+    cleaned.loc[0, 'notes'] = 'z'
+    
+    pd.testing.assert_frame_equal(source, original)
+    assert derived['budget_variance'].tolist() == [20.0, -50.0]
+    assert derived['completion_percentage'].tolist() == [25.0, 50.0]
+    assert normalized['start'].dtype.kind == 'M'
+
+
+@pytest.mark.parametrize("engine", ['pyarrow', 'c'])
+def test_load_project_data_parses_dates(processor, tmp_path, monkeypatch, engine):
+    if engine == 'pyarrow':
+        pytest.importorskip('pyarrow')
+    monkeypatch.setattr('src.data_processor.CSV_ENGINE', engine)
+    path = tmp_path / "projects.csv"
+    path.write_text(
+        "project_id,budget,start_date,end_date\n"
+        "PROJ-001,100.5,2024-01-01,2024-06-30\n"
+        "PROJ-002,,,2024-12-31\n"
+    )
+    df = processor.load_project_data(str(path), dtype={'budget': 'float32'},
+                                     parse_dates=['start_date', 'end_date'])
+    assert df['budget'].dtype == np.float32
+    assert df['start_date'].dtype.kind == 'M'
+    assert df['end_date'].dtype.kind == 'M'
+    assert df['start_date'].iloc[0] == pd.Timestamp('2024-01-01')
+    assert pd.isna(df['start_date'].iloc[1])